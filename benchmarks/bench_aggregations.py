@@ -0,0 +1,62 @@
+"""Доли статусов миссий по компаниям: цикл по компаниям против одной группировки.
+
+Число компаний в синтетических данных растет до десятков тысяч, чтобы было видно,
+как исходный цикл (O(компаний x строк)) отстает от groupby.
+
+    python -m benchmarks.bench_aggregations --rows 200000 --companies 100 1000 10000 50000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.synthetic import make_launches
+from launches import aggregations, preprocessing
+
+
+def legacy_shares(df, status):
+    percentile = df[df['Status Mission'] == status].groupby('Company Name', observed=True)[
+        'Status Mission'].count().astype('float64')
+    for company in percentile.index:
+        percentile[company] = (percentile[company] / len(
+            df[df['Company Name'] == company])) * 100
+    return percentile.sort_index()
+
+
+def with_companies(df, n_companies, seed=0):
+    rng = np.random.default_rng(seed)
+    df = df.copy()
+    df['Company Name'] = (
+        df['Company Name'].astype(str) + '-' + rng.integers(0, n_companies, len(df)).astype(str))
+    df['Company Name'] = df['Company Name'].astype('category')
+    return df
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--companies', type=int, nargs='*', default=[100, 1_000, 10_000, 50_000])
+    parser.add_argument('--legacy-limit', type=int, default=1_000,
+                        help='исходный цикл замеряется только до этого числа компаний')
+    args = parser.parse_args()
+
+    base = preprocessing.preprocess(make_launches(args.rows))
+    print(f'{args.rows} rows')
+    for n_companies in args.companies:
+        df = with_companies(base, n_companies)
+        grouped = timed(aggregations.status_shares, df, 'Company Name')
+        line = f'  {n_companies:>6} companies  groupby {grouped:8.3f} s'
+        if n_companies <= args.legacy_limit:
+            legacy = timed(legacy_shares, df, 'Success') + timed(legacy_shares, df, 'Failure')
+            line += f'   loop {legacy:8.3f} s'
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""Фильтры боковой панели: индекс битовых карт против булевых масок по таблице.
+
+Для случайных сочетаний фильтров (страна, компания, семейство, диапазон лет)
+замеряется выбор строк по индексу и маской pandas, а также пересчет графиков
+по отфильтрованному кубу.
+
+    python -m benchmarks.bench_filters --rows 1000000 --queries 200
+"""
+import argparse
+import statistics
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import make_launches
+from launches import cube, figures, filters, preprocessing
+
+
+def random_filters(index, rng):
+    chosen = {}
+    for column in filters.COLUMNS:
+        if rng.random() < 0.5:
+            options = index.options(column)
+            chosen[column] = list(rng.choice(options, size=min(len(options), rng.integers(1, 4)),
+                                             replace=False))
+    low, high = index.year_bounds()
+    if rng.random() < 0.7:
+        start, end = sorted(rng.integers(low, high + 1, size=2))
+        chosen[filters.YEAR] = (int(start), int(end))
+    return chosen
+
+
+def mask_positions(df, chosen):
+    mask = pd.Series(True, index=df.index)
+    for column, value in chosen.items():
+        if column == filters.YEAR:
+            mask &= df[column].between(*value)
+        else:
+            mask &= df[column].isin(value)
+    return np.flatnonzero(mask.to_numpy())
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    df = preprocessing.preprocess(make_launches(args.rows).drop(
+        columns=['Unnamed: 0.1', 'Unnamed: 0'], errors='ignore'))
+    launches = cube.build_cube(df)
+    seconds, frame_index = timed(filters.FilterIndex, df)
+    print(f'rows index: {seconds:.3f} s, {sum(x.nbytes for x in frame_index.bitmaps.values()) / 2**20:.1f} MiB')
+    seconds, cube_index = timed(filters.FilterIndex, launches)
+    print(f'cube index: {seconds:.3f} s for {len(launches)} groups')
+
+    rng = np.random.default_rng(args.seed)
+    bits, indexed, masked, redraw = [], [], [], []
+    for _ in range(args.queries):
+        chosen = random_filters(frame_index, rng)
+        bits.append(timed(frame_index.bits, chosen)[0])
+        seconds, positions = timed(frame_index.positions, chosen)
+        indexed.append(seconds)
+        seconds, expected = timed(mask_positions, df, chosen)
+        masked.append(seconds)
+        assert positions is None and not chosen or np.array_equal(positions, expected)
+        subset = cube_index.select(launches, chosen)
+        if len(subset):
+            redraw.append(timed(lambda: [f(subset) for f in figures.CUBE_FIGURES.values()])[0])
+
+    for name, samples in [('bitmap AND/OR', bits), ('index -> positions', indexed),
+                          ('pandas masks', masked), ('cube figures', redraw)]:
+        print(f'{name:<20} median {statistics.median(samples) * 1000:8.3f} ms'
+              f'   p95 {np.percentile(samples, 95) * 1000:8.3f} ms')
+
+
+if __name__ == '__main__':
+    main()
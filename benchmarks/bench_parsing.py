@@ -0,0 +1,56 @@
+"""Пропускная способность разбора колонок Datum и Rocket.
+
+    python -m benchmarks.bench_parsing --rows 2000000 5000000 --legacy
+"""
+import argparse
+import time
+
+import pandas as pd
+
+from benchmarks.synthetic import make_launches
+from launches import parsing
+
+
+def legacy_datum(datum):
+    return pd.to_datetime(datum.str.replace(' UTC', '', regex=False), format='mixed')
+
+
+def legacy_cost(cost):
+    return cost.apply(lambda x: str(x).replace(',', '')).astype('float64')
+
+
+STAGES = {
+    'Datum': (legacy_datum, parsing.parse_datum),
+    'Rocket': (legacy_cost, parsing.parse_cost),
+}
+
+
+def throughput(func, column):
+    start = time.perf_counter()
+    parsed = func(column)
+    seconds = time.perf_counter() - start
+    return seconds, len(column) / seconds, parsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='*', default=[2_000_000])
+    parser.add_argument('--legacy', action='store_true',
+                        help='замерить также разбор с выводом формата и построчный .apply')
+    args = parser.parse_args()
+
+    for n_rows in args.rows:
+        df = make_launches(n_rows).rename(columns={' Rocket': 'Rocket'})
+        print(f'{n_rows:>9} rows')
+        for column, (old, new) in STAGES.items():
+            seconds, rate, parsed = throughput(new, df[column])
+            malformed = parsing.count_malformed(df[column], parsed)
+            line = f'  {column:<7} {seconds:8.3f} s {rate:>12,.0f} rows/s  malformed {malformed}'
+            if args.legacy:
+                seconds, rate, _ = throughput(old, df[column])
+                line += f'   legacy {seconds:8.3f} s {rate:>12,.0f} rows/s'
+            print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""Сравнение построчной (.apply) и векторизованной предобработки по этапам.
+
+Запуск из корня репозитория:
+
+    python -m benchmarks.bench_preprocessing --rows 1000000 --legacy
+"""
+import argparse
+import time
+
+from benchmarks.synthetic import SOURCE_PATH, make_launches
+from launches import parsing, preprocessing, vehicles
+
+
+LEGACY_COUNTRIES = {
+    'Russia': 'Russian Federation',
+    "Barents Sea": 'Russian Federation',
+    'New Mexico': 'USA',
+    "Pacific Missile Range Facility": 'USA',
+    "Gran Canaria": 'USA',
+    "Yellow Sea": 'China',
+    "Shahrud Missile Test Site": "Iran"
+}
+
+
+def legacy_country(df):
+    country = df['Location'].apply(lambda location: location.split(',')[-1].strip())
+    return country.replace(LEGACY_COUNTRIES)
+
+
+def legacy_dates(df):
+    datum = parsing.parse_datum(df['Datum'])
+    return (datum.apply(lambda datetime: datetime.year),
+            datum.apply(lambda datetime: datetime.month),
+            datum.apply(lambda datetime: datetime.weekday()))
+
+
+def legacy_vehicles(df):
+    def get_vehicles(detail):
+        list_vehicles = []
+        for ele in [x.strip() for x in detail.split('|')]:
+            for family in vehicles.VEHICLE_FAMILIES:
+                if family in ele:
+                    list_vehicles.append(family)
+                    break
+            else:
+                list_vehicles.append('Other')
+        return list_vehicles
+
+    return df['Detail'].apply(get_vehicles)
+
+
+def vectorized_dates(df):
+    datum = parsing.parse_datum(df['Datum'])
+    return datum.dt.year, datum.dt.month, datum.dt.weekday
+
+
+STAGES = {
+    'location': (legacy_country, lambda df: preprocessing.extract_location(df['Location'])),
+    'dates': (legacy_dates, vectorized_dates),
+    'vehicles': (legacy_vehicles, lambda df: vehicles.classify(df['Detail'])),
+}
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def run(df, legacy):
+    print(f'{len(df):>9} rows')
+    for stage, (old, new) in STAGES.items():
+        line = f'  {stage:<10} vectorized {timed(new, df):8.3f} s'
+        if legacy:
+            line += f'   apply {timed(old, df):8.3f} s'
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='*', default=[1_000_000],
+                        help='размеры синтетических датасетов')
+    parser.add_argument('--legacy', action='store_true',
+                        help='замерить также исходную реализацию на .apply')
+    args = parser.parse_args()
+
+    run(preprocessing.read_launches(SOURCE_PATH), legacy=True)
+    for n_rows in args.rows:
+        run(make_launches(n_rows), legacy=args.legacy)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""Холодный старт приложения: первый показ страницы в новом процессе.
+
+Каждый замер запускается в отдельном процессе интерпретатора, как на только что
+поднятом контейнере. Кроме времени печатается, какие тяжелые библиотеки успели
+импортироваться к моменту показа первого раздела.
+
+    python -m benchmarks.bench_startup --repeat 3
+"""
+import argparse
+import json
+import subprocess
+import sys
+
+HEAVY_MODULES = ['plotly', 'matplotlib', 'pywaffle', 'sklearn']
+
+_PROBE = '''
+import json, sys, time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({script!r}, default_timeout=600)
+at.run()
+first_view = time.perf_counter() - start
+loaded = [name for name in {heavy!r} if name in sys.modules]
+sections = {{}}
+if {sections!r}:
+    for option in at.sidebar.radio[0].options[1:]:
+        section_start = time.perf_counter()
+        at.sidebar.radio[0].set_value(option).run()
+        sections[option] = time.perf_counter() - section_start
+errors = [e.value for e in at.exception]
+print(json.dumps({{'first_view': first_view, 'loaded': loaded, 'sections': sections,
+                  'errors': errors}}))
+'''
+
+
+def probe(script, sections=False):
+    code = _PROBE.format(script=script, heavy=HEAVY_MODULES, sections=sections)
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                            check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--script', default='main.py')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--sections', action='store_true',
+                        help='замерить также первое открытие каждого раздела')
+    args = parser.parse_args()
+
+    for _ in range(args.repeat):
+        result = probe(args.script, args.sections)
+        print(f"first view {result['first_view']:.3f} s, loaded: {', '.join(result['loaded'])}")
+        for section, seconds in result['sections'].items():
+            print(f'  {section[:60]:<60} {seconds:.3f} s')
+        for error in result['errors']:
+            print(f'  error: {error}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+"""Замер всего конвейера отчета по этапам, без браузера.
+
+Для каждого масштаба (во сколько раз больше Space_Corrected.csv) генерируется
+синтетический CSV, затем по очереди замеряются чтение, шаги предобработки,
+построение куба, агрегаты и все графики: время и пиковая память (tracemalloc).
+Результат пишется в JSON, который можно сравнить с прошлым прогоном:
+
+    python -m benchmarks.run --scales 10 100 1000 --output bench.json
+    python -m benchmarks.run --scales 10 --baseline bench.json --tolerance 1.25
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+from benchmarks.synthetic import SOURCE_PATH, write_launches
+from launches import aggregations, cube, figures, preprocessing
+
+BASE_ROWS = sum(1 for _ in open(SOURCE_PATH, encoding='utf-8')) - 1
+
+
+def measure(results, scale, stage, func, *args, memory=True):
+    gc.collect()
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    result = func(*args)
+    seconds = time.perf_counter() - start
+    peak = None
+    if memory:
+        peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        tracemalloc.stop()
+    results.append({'scale': scale, 'stage': stage, 'seconds': seconds, 'peak_mb': peak})
+    line = f'  {stage:<32} {seconds:9.3f} s'
+    if peak is not None:
+        line += f' {peak:10.1f} MB'
+    print(line, flush=True)
+    return result
+
+
+def run_scale(scale, results, memory=True, workdir=None):
+    n_rows = BASE_ROWS * scale
+    print(f'x{scale}: {n_rows} rows', flush=True)
+    path = write_launches(os.path.join(workdir, f'launches_x{scale}.csv'), n_rows, seed=scale)
+
+    df = measure(results, scale, 'load:read_csv', preprocessing.read_launches, path, memory=memory)
+    for name, step in preprocessing.STEPS.items():
+        measure(results, scale, f'preprocess:{name}', step, df, memory=memory)
+    launches = measure(results, scale, 'aggregate:cube', cube.build_cube, df, memory=memory)
+
+    aggregates = {
+        'company_status_shares': lambda: aggregations.status_shares(
+            launches, 'Company Name', weight='Launches'),
+        'country_status_shares': lambda: aggregations.status_shares(
+            launches, 'Country', weight='Launches'),
+        'cumulative_launches': lambda: cube.cumulative_launches(launches),
+        'mean_cost': lambda: cube.mean_cost(launches, 'Year'),
+    }
+    for name, func in aggregates.items():
+        measure(results, scale, f'aggregate:{name}', func, memory=memory)
+
+    measure(results, scale, 'figure:waffle',
+            lambda: figures.waffle_png(figures.status_distribution(launches)), memory=memory)
+    for name in figures.FIGURES:
+        measure(results, scale, f'figure:{name}', figures.build, name, launches, df,
+                memory=memory)
+    os.remove(path)
+
+
+def compare(results, baseline, tolerance):
+    """Этапы, которые стали медленнее базового прогона больше чем в tolerance раз."""
+    previous = {(x['scale'], x['stage']): x['seconds'] for x in baseline['results']}
+    regressions = []
+    for result in results:
+        before = previous.get((result['scale'], result['stage']))
+        if before and result['seconds'] > before * tolerance:
+            regressions.append({**result, 'baseline_seconds': before})
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scales', type=int, nargs='*', default=[10, 100, 1000])
+    parser.add_argument('--output', help='куда записать результаты в JSON')
+    parser.add_argument('--baseline', help='JSON прошлого прогона для сравнения')
+    parser.add_argument('--tolerance', type=float, default=1.25)
+    parser.add_argument('--no-memory', action='store_true',
+                        help='не замерять память (tracemalloc замедляет этапы)')
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for scale in args.scales:
+            run_scale(scale, results, memory=not args.no_memory, workdir=workdir)
+
+    report = {
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'base_rows': BASE_ROWS,
+        'memory': not args.no_memory,
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(results, json.load(file), args.tolerance)
+        for regression in regressions:
+            print(f"regression x{regression['scale']} {regression['stage']}: "
+                  f"{regression['baseline_seconds']:.3f} s -> {regression['seconds']:.3f} s")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
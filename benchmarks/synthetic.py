@@ -0,0 +1,66 @@
+"""Синтетические датасеты запусков произвольного размера.
+
+Строки выбираются с возвращением из Space_Corrected.csv, размноженного в
+variety копий, поэтому распределения компаний, мест запуска и ракет
+повторяют реальные. Нулевая копия - сами реальные строки; в остальных к
+названиям компании, площадки и ракеты добавляется суффикс -<копия>, а дата
+сдвигается на случайное число дней в пределах variety лет (не больше
+MAX_YEARS). Так вместе с числом строк растет и число различных значений, а с
+ним размер куба и индексов фильтров. variety=1 - выборка одних лишь реальных
+строк.
+"""
+import numpy as np
+import pandas as pd
+
+from launches import parsing
+
+SOURCE_PATH = 'Space_Corrected.csv'
+MAX_YEARS = 200
+
+
+def default_variety(n_rows, n_source):
+    """Число копий по умолчанию: растет как корень из отношения размеров."""
+    return max(1, round((n_rows / n_source) ** 0.5))
+
+
+def _suffixed(values, suffix, separator):
+    """Добавить suffix к части строки до первого separator."""
+    parts = values.str.partition(separator)
+    name = parts[0].str.rstrip()
+    # пробелы перед разделителем сохраняются: 'Falcon 9 | ...' -> 'Falcon 9-3 | ...'
+    spaces = parts[0].str.extract(r'(\s*)$', expand=False)
+    return name + suffix + spaces + parts[1] + parts[2]
+
+
+def expand(base, variety, rng):
+    """variety копий base: названия с суффиксами и сдвинутые даты у всех копий, кроме нулевой."""
+    copies = np.repeat(np.arange(variety), len(base))
+    df = pd.concat([base] * variety, ignore_index=True)
+    copied = copies > 0
+    suffix = pd.Series('-' + copies[copied].astype(str), index=df.index[copied])
+    df.loc[copied, 'Company Name'] = df.loc[copied, 'Company Name'] + suffix
+    df.loc[copied, 'Location'] = _suffixed(df.loc[copied, 'Location'], suffix, ',')
+    df.loc[copied, 'Detail'] = _suffixed(df.loc[copied, 'Detail'], suffix, '|')
+
+    years = min(variety, MAX_YEARS)
+    datum = df.loc[copied, 'Datum']
+    days = rng.integers(0, int(years * 365.25), size=len(datum))
+    shifted = parsing.parse_datum(datum) + pd.to_timedelta(days, unit='D')
+    df.loc[copied, 'Datum'] = shifted.dt.strftime('%a %b %d, %Y %H:%M UTC').where(
+        datum.str.endswith('UTC'), shifted.dt.strftime('%a %b %d, %Y'))
+    return df
+
+
+def make_launches(n_rows, seed=0, source=SOURCE_PATH, variety=None):
+    base = pd.read_csv(source)
+    rng = np.random.default_rng(seed)
+    variety = variety or default_variety(n_rows, len(base))
+    positions = rng.integers(0, len(base) * variety, size=n_rows)
+    if variety > 1:
+        base = expand(base, variety, rng)
+    return base.iloc[positions].reset_index(drop=True)
+
+
+def write_launches(path, n_rows, seed=0, source=SOURCE_PATH, variety=None):
+    make_launches(n_rows, seed, source, variety).to_csv(path, index=False)
+    return path
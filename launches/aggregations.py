@@ -0,0 +1,33 @@
+"""Агрегаты по статусам миссий, считаются за один проход группировки."""
+import pandas as pd
+
+
+def status_counts(df, by, weight=None):
+    """Число запусков каждого статуса миссии для каждой группы by (широкая таблица).
+
+    weight - колонка с числом запусков в строке, если df уже агрегирован (например, куб).
+    """
+    if weight is None:
+        counts = df.groupby(by, observed=True)['Status Mission'].value_counts()
+    else:
+        keys = [by] if isinstance(by, str) else list(by)
+        counts = df.groupby(keys + ['Status Mission'], observed=True)[weight].sum()
+    return counts.unstack(fill_value=0)
+
+
+def status_shares(df, by, weight=None):
+    """Число и доля (в процентах) запусков каждого статуса внутри группы by.
+
+    Возвращает длинную таблицу с колонками by, 'Status Mission', 'Count' и 'Share'.
+    by может быть любой колонкой (или списком колонок): 'Company Name', 'Country',
+    'Vehicle Family', 'Year' и т.д.
+    """
+    counts = status_counts(df, by, weight)
+    shares = counts.div(counts.sum(axis=1), axis=0) * 100
+    return pd.concat({'Count': counts.stack(), 'Share': shares.stack()}, axis=1).reset_index()
+
+
+def status_share(shares, status):
+    """Доля одного статуса из результата status_shares, индексированная по группе."""
+    keys = [x for x in shares.columns if x not in ('Status Mission', 'Count', 'Share')]
+    return shares[shares['Status Mission'] == status].set_index(keys)['Share']
@@ -0,0 +1,126 @@
+"""Статическая сборка отчета: все графики и небольшие агрегаты заранее.
+
+Сборка прогоняет весь конвейер один раз и пишет в каталог
+<ARTIFACT_DIR>/<ключ>/ графики в JSON, картинку waffle и агрегаты в CSV
+(tables/), а также manifest.json. Ключ сборки - хеш содержимого исходного CSV
+вместе с хешем всего пакета launches и справочников launches/data
+(storage.code_hash). Поэтому сборку можно сделать заранее, на другой
+машине или на этапе сборки приложения, и она останется действительной, пока не
+изменятся данные, код или справочники. Приложение берет график из сборки, только
+если ключ совпадает с данными, которые оно загрузило.
+
+Сборка выполняется на этапе сборки приложения (bin/post_compile), а не при
+запуске:
+
+    python -m launches.artifacts Space_Corrected.csv
+"""
+import json
+import os
+import shutil
+import sys
+import time
+
+from launches import aggregations, cube, figures, storage
+
+ARTIFACT_DIR = os.environ.get('LAUNCHES_ARTIFACT_DIR', 'build')
+KEEP_BUILDS = 3
+
+
+def build_key(source_hash):
+    return f'{source_hash[:20]}-{storage.code_hash()[:12]}'
+
+
+def aggregate_tables(launches):
+    return {
+        'company_status_shares': aggregations.status_shares(
+            launches, 'Company Name', weight='Launches'),
+        'country_status_shares': aggregations.status_shares(
+            launches, 'Country', weight='Launches'),
+        'cumulative_launches': cube.cumulative_launches(launches),
+        'mean_cost': cube.mean_cost(launches, 'Year').rename('Mean Cost').reset_index(),
+    }
+
+
+def build(csv_path, artifact_dir=None):
+    """Собрать все артефакты для текущего содержимого csv_path. Возвращает каталог сборки."""
+    artifact_dir = artifact_dir or ARTIFACT_DIR
+    source_hash = storage.content_hash(csv_path)
+    df = storage.load_launches(csv_path)
+    launches = cube.build_cube(df)
+
+    target = os.path.join(artifact_dir, build_key(source_hash))
+    tmp_target = f'{target}.{os.getpid()}.tmp'
+    os.makedirs(os.path.join(tmp_target, 'figures'))
+    os.makedirs(os.path.join(tmp_target, 'tables'))
+    for name in figures.FIGURES:
+        with open(os.path.join(tmp_target, 'figures', f'{name}.json'), 'w') as file:
+            file.write(figures.build(name, launches, df).to_json())
+    with open(os.path.join(tmp_target, 'waffle.png'), 'wb') as file:
+        file.write(figures.waffle_png(figures.status_distribution(launches)))
+    tables = aggregate_tables(launches)
+    for name, table in tables.items():
+        table.to_csv(os.path.join(tmp_target, 'tables', f'{name}.csv'), index=False)
+    with open(os.path.join(tmp_target, 'manifest.json'), 'w') as file:
+        json.dump({'source': os.path.basename(csv_path), 'source_hash': source_hash,
+                   'code_hash': storage.code_hash(), 'built_at': time.time(),
+                   'figures': list(figures.FIGURES), 'tables': list(tables)}, file)
+
+    shutil.rmtree(target, ignore_errors=True)
+    os.replace(tmp_target, target)
+    _prune(artifact_dir)
+    return target
+
+
+def _prune(artifact_dir):
+    builds = [x for x in os.listdir(artifact_dir)
+              if os.path.isfile(os.path.join(artifact_dir, x, 'manifest.json'))]
+    builds.sort(key=lambda x: os.path.getmtime(os.path.join(artifact_dir, x)))
+    for name in builds[:-KEEP_BUILDS]:
+        shutil.rmtree(os.path.join(artifact_dir, name), ignore_errors=True)
+
+
+def current_dir(source_hash, artifact_dir=None):
+    """Каталог сборки для данных с хешем source_hash и текущего кода или None."""
+    if source_hash is None:
+        return None
+    path = os.path.join(artifact_dir or ARTIFACT_DIR, build_key(source_hash))
+    try:
+        with open(os.path.join(path, 'manifest.json')) as file:
+            manifest = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if manifest['source_hash'] != source_hash or manifest['code_hash'] != storage.code_hash():
+        return None
+    return path
+
+
+def load_figure(name, source_hash, artifact_dir=None):
+    path = current_dir(source_hash, artifact_dir)
+    if path is None:
+        return None
+    import plotly.io
+
+    with open(os.path.join(path, 'figures', f'{name}.json')) as file:
+        return plotly.io.from_json(file.read(), skip_invalid=True)
+
+
+def load_waffle(source_hash, artifact_dir=None):
+    path = current_dir(source_hash, artifact_dir)
+    if path is None:
+        return None
+    with open(os.path.join(path, 'waffle.png'), 'rb') as file:
+        return file.read()
+
+
+def load_table(name, source_hash, artifact_dir=None):
+    path = current_dir(source_hash, artifact_dir)
+    if path is None:
+        return None
+    import pandas as pd
+
+    return pd.read_csv(os.path.join(path, 'tables', f'{name}.csv'))
+
+
+if __name__ == '__main__':
+    for csv_path in sys.argv[1:] or ['Space_Corrected.csv']:
+        print(f'{csv_path} -> {build(csv_path)}')
@@ -0,0 +1,59 @@
+"""Предрассчитанный куб количества запусков.
+
+Куб строится один раз на версию датасета: это число запусков (и суммарная
+стоимость) для каждого сочетания измерений DIMENSIONS. Все графики отчета
+получаются суммированием среза куба, без прохода по исходным строкам.
+"""
+import pandas as pd
+
+DIMENSIONS = ['Country', 'Company Name', 'Year', 'Month', 'Weekday', 'Status Mission',
+              'Vehicle Family']
+MEASURES = ['Launches', 'Cost', 'Costed Launches']
+
+
+def build_cube(df):
+    costed = df['Rocket'] > 0
+    measures = pd.DataFrame({
+        'Launches': 1,
+        'Cost': df['Rocket'].where(costed, 0).astype('float64'),
+        'Costed Launches': costed.astype('int64'),
+    })
+    for column in DIMENSIONS:
+        measures[column] = df[column]
+    return measures.groupby(DIMENSIONS, observed=True)[MEASURES].sum().reset_index()
+
+
+def slice_cube(cube, filters):
+    """Срез куба: {измерение: значение или список значений}, например {'Year': [1990, 1991]}."""
+    mask = pd.Series(True, index=cube.index)
+    for column, value in filters.items():
+        if isinstance(value, (list, tuple, set)):
+            mask &= cube[column].isin(value)
+        else:
+            mask &= cube[column] == value
+    return cube[mask]
+
+
+def rollup(cube, by, measure='Launches'):
+    return cube.groupby(by, observed=True)[measure].sum()
+
+
+def mean_cost(cube, by):
+    totals = rollup(cube, by, ['Cost', 'Costed Launches'])
+    totals = totals[totals['Costed Launches'] > 0]
+    return totals['Cost'] / totals['Costed Launches']
+
+
+def cumulative_launches(cube, by='Country'):
+    """Накопленное число запусков по годам в формате Total_Launch.csv.
+
+    Для каждой группы есть строка на каждый год от первого до последнего запуска в датасете.
+    """
+    counts = rollup(cube, ['Year', by]).unstack(fill_value=0)
+    years = range(counts.index.min(), counts.index.max() + 1)
+    counts = counts.reindex(years, fill_value=0).cumsum()
+    counts.index.name = 'Year'
+    return (counts.stack()
+            .rename('Cummulative_Launches')
+            .astype('float64')
+            .reset_index()[['Year', by, 'Cummulative_Launches']])
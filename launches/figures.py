@@ -0,0 +1,219 @@
+"""Построение графиков отчета.
+
+Каждая функция получает куб запусков (launches/cube.py) или предобработанную
+таблицу и возвращает готовую фигуру, поэтому графики можно строить и замерять
+без Streamlit. plotly, matplotlib и pywaffle импортируются внутри функций, чтобы
+не замедлять старт приложения, пока соответствующий раздел не открыт.
+"""
+import io
+
+from launches import aggregations, cube, sampling
+
+STATUS_COLORS = {
+    'Failure': 'Tomato',
+    'Partial Failure': 'DarkOrange',
+    'Prelaunch Failure': 'Plum',
+    'Success': 'DeepSkyBlue',
+}
+
+
+def status_distribution(launches):
+    data = cube.rollup(launches, 'Status Mission').sort_values(ascending=False)
+    return dict(data / data.sum() * 100)
+
+
+def waffle_png(data):
+    import matplotlib.pyplot as plt
+    from pywaffle import Waffle
+
+    with plt.rc_context({'figure.figsize': (7, 11), 'axes.facecolor': '#F0F2F6'}):
+        fig = plt.figure(
+            FigureClass=Waffle,
+            columns=10,
+            values=data,
+            # после фильтров статусов может быть меньше четырех
+            colors=("MediumSpringGreen", "Tomato", "#ff9d3b", "#ffff3b")[:len(data)],
+            title={'label': 'Статус миссии', 'loc': 'center'},
+            icons='space-shuttle',
+            icon_size=20,
+            labels=[f"{k} {v:.2f}%" for k, v in data.items()],
+            legend={'loc': 'lower left', 'bbox_to_anchor': (0, -0.2), 'ncol': len(data)},
+        )
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png', bbox_inches='tight')
+        plt.close(fig)
+    return buffer.getvalue()
+
+
+def total_launches_figure(launches):
+    import plotly.express as px
+
+    total_launches = cube.cumulative_launches(launches)
+    max_launches = total_launches['Cummulative_Launches'].max()
+    fig = px.bar(total_launches, x="Country", y="Cummulative_Launches", color="Country",
+                 animation_group="Country", animation_frame="Year",
+                 range_y=[0, max_launches * 1.1])
+    fig.update_layout(
+        title={
+            'text': "Количество запусков ракотоносителей",
+            'y': 0.95,
+            'x': 0.5,
+            'xanchor': 'center',
+            'yanchor': 'top'},
+        xaxis_title="",
+        yaxis_title="Количество запусков")
+    return fig
+
+
+def country_status_figure(launches):
+    import plotly.graph_objs as go
+    from plotly.subplots import make_subplots
+
+    shares = aggregations.status_shares(launches, 'Country', weight='Launches')
+    shares = shares[shares['Count'] > 0].sort_values(['Country', 'Share'],
+                                                     ascending=[True, False])
+    countries = shares['Country'].unique()
+    fig = make_subplots(rows=(len(countries) + 1) // 2, cols=2, subplot_titles=countries)
+    for i, country in enumerate(countries):
+        counts = shares[shares['Country'] == country].set_index('Status Mission')['Share']
+        color = [STATUS_COLORS.get(x, 'Grey') for x in counts.index]
+        trace = go.Bar(x=counts.index, y=counts.values, name=country, showlegend=False,
+                       marker={'color': color})
+        fig.add_trace(trace, row=(i // 2) + 1, col=(i % 2) + 1)
+
+    fig.update_layout(template='gridon',
+                      margin=dict(l=80, r=80, t=50, b=50),
+                      title={'text': 'Статус миссий (по странам)', 'x': 0.5},
+                      height=1500,
+                      width=700)
+    for i in range(1, (len(countries) + 1) // 2 + 1):
+        fig.update_yaxes(title_text='Процентиль', row=i, col=1)
+    return fig
+
+
+def company_status_figure(launches):
+    import plotly.graph_objs as go
+
+    shares = aggregations.status_shares(launches, 'Company Name', weight='Launches')
+    SuccessPercentile = aggregations.status_share(shares, 'Success')
+    FailurePercentile = aggregations.status_share(shares, 'Failure')
+
+    trace1 = go.Bar(x=SuccessPercentile.index, y=SuccessPercentile.values,
+                    name='Процент успешных запусков',
+                    opacity=0.7)
+    trace2 = go.Bar(x=FailurePercentile.index, y=FailurePercentile.values,
+                    name='Процент неудачных запусков',
+                    opacity=0.7, visible='legendonly')
+
+    fig = go.Figure([trace1, trace2])
+    fig.update_layout(template='gridon', margin=dict(l=80, r=80, t=100, b=100),
+                      barmode='stack',
+                      title={'text': 'Насколько успешны запуски каждой компании', 'x': 0.5},
+                      width=750, yaxis_title='Процентиль', xaxis_title='',
+                      legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="center",
+                                  x=0.5))
+    return fig
+
+
+def treemap_figure(launches):
+    import plotly.express as px
+
+    path = ['Status Mission', 'Country', 'Company Name']
+    fig = px.treemap(cube.rollup(launches, path).reset_index(), path=path,
+                     values='Launches')
+    fig.update_layout(template='gridon', margin=dict(l=80, r=80, t=50, b=10),
+                      title={'text': 'Статус миссии: страны и компании', 'x': 0.5})
+    return fig
+
+
+def vehicles_figure(launches):
+    import plotly.express as px
+
+    counts = cube.rollup(launches, 'Vehicle Family').sort_values(ascending=False)
+    counts = counts.rename('Count').to_frame()
+    return px.pie(counts, values='Count', names=counts.index)
+
+
+def failures_figure(launches):
+    import plotly.graph_objs as go
+    from plotly.subplots import make_subplots
+
+    fig = make_subplots(rows=3, cols=1)
+    for i, period in enumerate(['Year', 'Month', 'Weekday']):
+        failures = cube.rollup(
+            cube.slice_cube(launches, {'Status Mission': 'Failure'}), period)
+        totals = cube.rollup(launches, period)
+        data = dict(failures.reindex(totals.index, fill_value=0) / totals * 100.0)
+        mean = sum(data.values()) / len(data)
+        if period == 'Year':
+            x = list(data.keys())
+        elif period == 'Month':
+            x = ['Январь', 'Февраль', 'Март', 'Апрель', 'Май', 'Июнь', 'Июль', 'Август',
+                 'Сентябрь', 'Осктябрь', 'Ноябрь', 'Декабрь']
+        else:
+            x = ['Понедельник', 'Вторник', 'Среда', 'Четверг', 'Пятница', 'Суббота',
+                 'Воскресенье']
+
+        trace1 = go.Scatter(x=x, y=list(data.values()), mode='lines', text=list(data.keys()),
+                            name=f'Провалы за {period} (англ.)', connectgaps=False)
+        trace2 = go.Scatter(x=x, y=[mean] * len(data), mode='lines', showlegend=False,
+                            name=f'Среднее количество провалов за {period}',
+                            line={'dash': 'dash', 'color':
+                                'grey'})
+        fig.append_trace(trace1, row=i + 1, col=1)
+        fig.append_trace(trace2, row=i + 1, col=1)
+    fig.update_layout(template='gridon', height=600,
+                      title={
+                          'text': 'Проваленные миссии за разные периоды времени',
+                          'x': 0.5})
+    for i in range(1, 4):
+        fig.update_yaxes(title_text='Процентиль', row=i, col=1)
+    return fig
+
+
+def mean_cost_figure(launches):
+    import plotly.graph_objs as go
+
+    costDict = dict(cube.mean_cost(launches, 'Year'))
+    fig = go.Figure(
+        go.Scatter(x=list(costDict.keys()), y=list(costDict.values()), yaxis='y2',
+                   mode='lines', showlegend=False, name='Стоимость миссий за год'))
+    fig.update_layout(template='gridon', margin=dict(l=80, r=80, t=50, b=50),
+                      title={'text': 'Средняя стоимость', 'x': 0.5},
+                      yaxis_title='Стоимость (млн. $)', xaxis_title='Год запуска')
+    return fig
+
+
+def company_cost_figure(df):
+    import plotly.express as px
+
+    points = sampling.limit_points(df[df['Rocket'].between(1, 4999)],
+                                   ['Year', 'Company Name', 'Status Mission'], 'Rocket')
+    fig = px.scatter(points, x='Year', y='Company Name', color='Status Mission',
+                     size='Rocket', size_max=30, hover_data=['Launches'])
+    fig.update_layout(template='gridon', margin=dict(l=80, r=80, t=50, b=50),
+                      title={'text': 'Стоимость запусков (по компаниям)',
+                             'x': 0.5}, height=650, yaxis_title='',
+                      xaxis_title='Год запуска')
+    return fig
+
+
+CUBE_FIGURES = {
+    'total_launches': total_launches_figure,
+    'country_status': country_status_figure,
+    'company_status': company_status_figure,
+    'treemap': treemap_figure,
+    'vehicles': vehicles_figure,
+    'failures': failures_figure,
+    'mean_cost': mean_cost_figure,
+}
+FRAME_FIGURES = {
+    'company_cost': company_cost_figure,
+}
+FIGURES = {**CUBE_FIGURES, **FRAME_FIGURES}
+
+
+def build(name, launches, df):
+    if name in FRAME_FIGURES:
+        return FRAME_FIGURES[name](df)
+    return CUBE_FIGURES[name](launches)
@@ -0,0 +1,92 @@
+"""Индексы для фильтров отчета: страна, компания, семейство ракеты и диапазон лет.
+
+Индекс строится один раз на таблицу (куб или строки запусков). Для каждого
+значения категориальной колонки хранится битовая карта его строк, упакованная
+по 8 строк в байт. Для лет хранится отсортированный список лет и для каждого из
+них карта строк с годом не больше данного, так что диапазон лет - это две
+карты и одна операция. Любое сочетание фильтров сводится к нескольким OR/AND
+над упакованными картами, без сравнений по всей таблице.
+
+Фильтры задаются словарем {колонка: список значений, 'Year': (от, до)};
+пустой список или None означает "без фильтра".
+"""
+import numpy as np
+import pandas as pd
+
+COLUMNS = ['Country', 'Company Name', 'Vehicle Family']
+YEAR = 'Year'
+
+
+def filter_key(filters):
+    """Хешируемое представление фильтров для ключей кеша; () - без фильтров."""
+    return tuple((column, tuple(value)) for column, value in sorted(filters.items()) if value)
+
+
+class FilterIndex:
+    def __init__(self, frame, columns=COLUMNS, year=YEAR):
+        self.size = len(frame)
+        self.year = year
+        self.labels = {}
+        self.bitmaps = {}
+        for column in columns:
+            values = frame[column]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                codes, labels = values.cat.codes.to_numpy(), list(values.cat.categories)
+            else:
+                codes, labels = pd.factorize(values, sort=True)
+                labels = list(labels)
+            self.labels[column] = labels
+            self.bitmaps[column] = np.stack(
+                [np.packbits(codes == code) for code in range(len(labels))]
+            ) if labels else np.zeros((0, (self.size + 7) // 8), dtype=np.uint8)
+        years = frame[year].to_numpy()
+        self.years = np.unique(years[~pd.isna(years)]).astype('int64')
+        # _year_prefix[i] - строки с годом <= self.years[i]
+        self._year_prefix = np.stack([np.packbits(years <= y) for y in self.years]) \
+            if len(self.years) else np.zeros((0, (self.size + 7) // 8), dtype=np.uint8)
+
+    def options(self, column):
+        return self.labels[column]
+
+    def year_bounds(self):
+        return int(self.years[0]), int(self.years[-1])
+
+    def _category_bits(self, column, values):
+        lookup = {label: code for code, label in enumerate(self.labels[column])}
+        codes = [lookup[x] for x in values if x in lookup]
+        if not codes:
+            return np.zeros(self.bitmaps[column].shape[1], dtype=np.uint8)
+        return np.bitwise_or.reduce(self.bitmaps[column][codes], axis=0)
+
+    def _year_bits(self, low, high):
+        hi = np.searchsorted(self.years, high, side='right') - 1
+        lo = np.searchsorted(self.years, low, side='left') - 1
+        width = self._year_prefix.shape[1]
+        if hi < 0 or hi <= lo:
+            return np.zeros(width, dtype=np.uint8)
+        bits = self._year_prefix[hi]
+        return bits & ~self._year_prefix[lo] if lo >= 0 else bits
+
+    def bits(self, filters):
+        """Упакованная карта выбранных строк или None, если фильтров нет."""
+        result = None
+        for column, value in filters.items():
+            if not value:
+                continue
+            if column == self.year:
+                bits = self._year_bits(*value)
+            else:
+                bits = self._category_bits(column, value)
+            result = bits if result is None else result & bits
+        return result
+
+    def positions(self, filters):
+        """Номера выбранных строк по возрастанию или None, если фильтров нет."""
+        bits = self.bits(filters)
+        if bits is None:
+            return None
+        return np.flatnonzero(np.unpackbits(bits, count=self.size))
+
+    def select(self, frame, filters):
+        positions = self.positions(filters)
+        return frame if positions is None else frame.take(positions)
@@ -0,0 +1,68 @@
+"""Справочник мест запуска: разбор колонки Location на площадку, космодром, регион и страну.
+
+Location имеет вид "площадка, космодром, [регион,] страна", но последняя часть
+не всегда страна: "Barents Sea", "Gran Canaria", "Shahrud Missile Test Site".
+Такие известные названия и их страны лежат в data/sites.csv. Там же указана
+страна-оператор для космодромов на чужой территории (Байконур).
+
+Каждое уникальное значение Location разбирается один раз, результат
+раскладывается обратно на строки через коды factorize, поэтому стоимость
+разбора растет с числом мест запуска, а не с числом строк.
+"""
+import csv
+import functools
+import os
+from typing import NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+SITES_PATH = os.path.join(os.path.dirname(__file__), 'data', 'sites.csv')
+FIELDS = ['pad', 'site', 'region', 'country', 'operator_country']
+
+
+class Site(NamedTuple):
+    pad: Optional[str]
+    site: Optional[str]
+    region: Optional[str]
+    country: Optional[str]
+    operator_country: Optional[str]
+
+
+@functools.lru_cache(maxsize=None)
+def known_names(path=SITES_PATH):
+    """{название: (вид, страна, страна-оператор)} из справочника."""
+    with open(path, newline='', encoding='utf-8') as file:
+        return {row['name']: (row['kind'], row['country'] or None, row['operator_country'] or None)
+                for row in csv.DictReader(file)}
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_location(location, path=SITES_PATH):
+    names = known_names(path)
+    *rest, last = [part.strip() for part in location.split(',')]
+    kind, country, _ = names.get(last, ('country', last, None))
+    fields = {'pad': None, 'site': None, 'region': None, 'country': country or last}
+    if kind != 'country':
+        fields[kind] = last
+    if len(rest) == 3:
+        fields['pad'], fields['site'], fields['region'] = rest
+    elif len(rest) == 2:
+        fields['pad'], fields['site'] = rest
+    elif len(rest) == 1:
+        fields['pad' if kind == 'site' else 'site'] = rest[0]
+    operator = names.get(fields['site'], (None, None, None))[2]
+    return Site(operator_country=operator or fields['country'], **fields)
+
+
+def locate(location, path=SITES_PATH):
+    """Разобранные поля для каждой строки Location: DataFrame с категориальными колонками FIELDS."""
+    codes, uniques = pd.factorize(location)
+    sites = pd.DataFrame([parse_location(x, path) for x in uniques], columns=FIELDS)
+    result = {}
+    for field in FIELDS:
+        field_codes, categories = pd.factorize(sites[field], sort=True)
+        # код -1 (пропуск в Location) указывает на добавленный в конец -1
+        values = np.append(field_codes, -1).astype(np.int32)[codes]
+        result[field] = pd.Categorical.from_codes(values, categories=categories)
+    return pd.DataFrame(result, index=location.index)
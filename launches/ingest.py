@@ -0,0 +1,173 @@
+"""Инкрементальная загрузка новых запусков.
+
+LaunchHistory хранит предобработанные строки и куб (launches/cube.py) в виде
+списка частей. Новая партия запусков нормализуется отдельно, и по ней строится
+свой маленький куб, поэтому добавление стоит пропорционально размеру партии.
+Части объединяются лениво, при первом чтении frame или cube.
+
+Если в конец CSV дописали строки, refresh() прочитает только новый хвост
+файла. Что уже прочитанная часть не менялась, проверяется по хешу всех
+прочитанных байтов: хеширование дешевле разбора, а хеш продлевается хвостом.
+Любое другое изменение файла приводит к полной перезагрузке.
+"""
+import io
+import os
+import threading
+from typing import NamedTuple, Optional
+
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from launches import cube, parsing, preprocessing, storage
+
+
+def normalize(rows):
+    """Предобработка партии запусков: путь к CSV, DataFrame или список словарей."""
+    if isinstance(rows, (str, os.PathLike)):
+        df = pd.read_csv(rows)
+    elif isinstance(rows, pd.DataFrame):
+        df = rows.copy()
+    else:
+        df = pd.DataFrame.from_records(rows)
+    df = df.drop(columns=['Unnamed: 0.1', 'Unnamed: 0'], errors='ignore')
+    return preprocessing.preprocess(df)
+
+
+def merge_cubes(parts):
+    merged = pd.concat(parts, ignore_index=True)
+    for column in cube.DIMENSIONS:
+        if not pd.api.types.is_numeric_dtype(merged[column]):
+            merged[column] = merged[column].astype('category')
+    return merged.groupby(cube.DIMENSIONS, observed=True)[cube.MEASURES].sum().reset_index()
+
+
+def merge_frames(parts):
+    """Склеить предобработанные части с общими категориями.
+
+    Категории объединяются без промежуточной колонки строк: у всех частей они
+    отсортированы, у Vehicle Family сохраняется порядок семейств.
+    """
+    columns = preprocessing.CATEGORICAL_COLUMNS + ['Vehicle Family']
+    merged = pd.concat([part.drop(columns=columns) for part in parts], ignore_index=True)
+    for column in columns:
+        merged[column] = union_categoricals(
+            [part[column].astype('category') for part in parts],
+            sort_categories=column != 'Vehicle Family')
+    merged = merged[parts[0].columns]
+    reports = [part.attrs['parse_report'] for part in parts if 'parse_report' in part.attrs]
+    if reports:
+        merged.attrs['parse_report'] = parsing.merge_reports(reports)
+    return merged
+
+
+class Snapshot(NamedTuple):
+    frame: pd.DataFrame
+    cube: pd.DataFrame
+    version: int
+    source_hash: Optional[str]
+
+
+class LaunchHistory:
+    def __init__(self, df, path=None):
+        self.path = path
+        self.version = 0
+        self._frames = [df]
+        self._cubes = [cube.build_cube(df)]
+        self._lock = threading.RLock()
+        self._appended = False
+        if path is not None:
+            self._remember_source(storage.source_version(path))
+
+    @classmethod
+    def from_csv(cls, path):
+        return cls(storage.load_launches(path), path)
+
+    @classmethod
+    def from_files(cls, source, workers=None):
+        """История из каталога или glob-шаблона CSV-файлов (см. launches/parallel.py)."""
+        from launches import parallel
+
+        return cls(parallel.load_files(source, workers))
+
+    def _remember_source(self, version, size=None, digest=None):
+        self._source_version = version
+        self._source_size = version[1] if size is None else size
+        if digest is None:
+            digest = storage.prefix_hash(self.path, self._source_size)
+        self._source_hash = digest.hexdigest()
+
+    @property
+    def source_hash(self):
+        """Хеш прочитанного содержимого CSV или None, если строки добавляли не из файла."""
+        if self.path is None or self._appended:
+            return None
+        return self._source_hash
+
+    def snapshot(self):
+        """Согласованные frame, cube, version и source_hash, прочитанные под одной блокировкой."""
+        with self._lock:
+            return Snapshot(self.frame, self.cube, self.version, self.source_hash)
+
+    @property
+    def frame(self):
+        with self._lock:
+            if len(self._frames) > 1:
+                self._frames = [merge_frames(self._frames)]
+            return self._frames[0]
+
+    @property
+    def cube(self):
+        with self._lock:
+            if len(self._cubes) > 1:
+                self._cubes = [merge_cubes(self._cubes)]
+            return self._cubes[0]
+
+    def append(self, rows):
+        """Добавить партию запусков. Возвращает её предобработанные строки."""
+        with self._lock:
+            self._appended = True
+            return self._append(rows)
+
+    def _append(self, rows):
+        new = normalize(rows)
+        if new.empty:
+            return new
+        delta = cube.build_cube(new)
+        with self._lock:
+            self._frames.append(new)
+            self._cubes.append(delta)
+            self.version += 1
+        return new
+
+    def refresh(self):
+        """Подхватить изменения CSV-файла. Возвращает True, если данные изменились.
+
+        История без файла (собранная из DataFrame или from_files) не обновляется.
+        """
+        if self.path is None:
+            return False
+        with self._lock:
+            version = storage.source_version(self.path)
+            if version == self._source_version:
+                return False
+            before = self.version
+            size = version[1]
+            digest = storage.prefix_hash(self.path, self._source_size) if size > self._source_size else None
+            if digest is not None and digest.hexdigest() == self._source_hash:
+                with open(self.path, 'rb') as file:
+                    header = file.readline()
+                    file.seek(self._source_size)
+                    tail = file.read(size - self._source_size)
+                # незаконченную последнюю строку дочитаем при следующем обновлении
+                tail = tail[:tail.rfind(b'\n') + 1]
+                if tail:
+                    self._append(pd.read_csv(io.BytesIO(header + tail)))
+                digest.update(tail)
+                self._remember_source(version, self._source_size + len(tail), digest)
+            else:
+                self._frames = [storage.load_launches(self.path)]
+                self._cubes = [cube.build_cube(self._frames[0])]
+                self._appended = False
+                self.version += 1
+                self._remember_source(version)
+            return self.version != before
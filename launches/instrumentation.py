@@ -0,0 +1,101 @@
+"""Легкие замеры одного перезапуска страницы.
+
+Замеры включаются переменной окружения LAUNCHES_PROFILE=1 (тогда каждый
+перезапуск пишется в лог одной JSON-строкой) или для отдельного перезапуска
+через start_run(enabled=True). Когда замеры выключены, timed() возвращает
+общий пустой контекстный менеджер, и накладные расходы сводятся к одной проверке.
+"""
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+ENABLED = os.environ.get('LAUNCHES_PROFILE', '').lower() in ('1', 'true', 'yes')
+
+_NULL = contextlib.nullcontext()
+_local = threading.local()
+
+
+def _rss_bytes():
+    try:
+        with open('/proc/self/statm') as file:
+            return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class Run:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.events = []
+        self.cache = {}
+
+    @contextlib.contextmanager
+    def timed(self, name):
+        rss = _rss_bytes()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            after = _rss_bytes()
+            delta = after - rss if rss is not None and after is not None else None
+            self.events.append({'name': name, 'seconds': seconds, 'rss_delta': delta})
+
+    def count(self, name, outcome):
+        counts = self.cache.setdefault(name, {'calls': 0, 'misses': 0})
+        counts[outcome] += 1
+
+    def summary(self):
+        cache = {name: {'hits': x['calls'] - x['misses'], 'misses': x['misses']}
+                 for name, x in self.cache.items()}
+        return {'seconds': time.perf_counter() - self.started, 'events': self.events,
+                'cache': cache}
+
+
+def current():
+    return getattr(_local, 'run', None)
+
+
+def start_run(enabled=False):
+    """Начать замеры перезапуска в текущем потоке. Возвращает Run или None."""
+    _local.run = Run() if enabled or ENABLED else None
+    return _local.run
+
+
+def finish_run():
+    run, _local.run = current(), None
+    if run is not None:
+        summary = run.summary()
+        logger.info(json.dumps(summary))
+        return summary
+    return None
+
+
+def timed(name):
+    run = current()
+    if run is None:
+        return _NULL
+    return run.timed(name)
+
+
+def cache_call(name):
+    """Отметить обращение к кешу; cache_miss вызывается внутри кешируемой функции."""
+    run = current()
+    if run is not None:
+        run.count(name, 'calls')
+
+
+def cache_miss(name):
+    run = current()
+    if run is not None:
+        run.count(name, 'misses')
+
+
+if ENABLED and not logger.handlers:
+    logger.addHandler(logging.StreamHandler())
+    logger.setLevel(logging.INFO)
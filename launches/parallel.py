@@ -0,0 +1,83 @@
+"""Параллельная загрузка набора CSV-файлов с запусками.
+
+Файлы читаются по очереди порциями по CHUNK_ROWS строк, а предобработка каждой
+порции (разбор дат и стоимости, страна, семейство ракеты) выполняется в пуле
+процессов. Одновременно в работе не больше двух порций на процесс, так что
+память ограничена размером порции, а не всего набора. Результаты собираются
+в порядке файлов и строк, поэтому итог не зависит от числа процессов.
+
+    python -m launches.parallel 'data/*.csv' --workers 4
+"""
+import argparse
+import collections
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from launches import ingest
+
+WORKERS = int(os.environ.get('LAUNCHES_WORKERS', 0)) or os.cpu_count() or 1
+CHUNK_ROWS = int(os.environ.get('LAUNCHES_CHUNK_ROWS', 200_000))
+
+
+def launch_files(source):
+    """Отсортированный список CSV-файлов: из каталога, по glob-шаблону или один файл."""
+    if os.path.isdir(source):
+        paths = glob.glob(os.path.join(source, '*.csv'))
+    else:
+        paths = glob.glob(source)
+    if not paths:
+        raise FileNotFoundError(f'no launch files match {source!r}')
+    return sorted(paths)
+
+
+def read_chunks(paths, chunk_rows=None):
+    for path in paths:
+        yield from pd.read_csv(path, chunksize=chunk_rows or CHUNK_ROWS)
+
+
+def _ordered_map(func, items, workers):
+    if workers == 1:
+        yield from map(func, items)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = collections.deque()
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def normalize_files(paths, workers=None):
+    """Предобработанные файлы paths целиком, по одному на процесс, в исходном порядке."""
+    workers = min(workers or WORKERS, len(paths)) or 1
+    return list(_ordered_map(ingest.normalize, paths, workers))
+
+
+def load_files(source, workers=None, chunk_rows=None):
+    """Предобработанный датасет из всех файлов source с общими категориями."""
+    chunks = read_chunks(launch_files(source), chunk_rows)
+    parts = [part for part in _ordered_map(ingest.normalize, chunks, workers or WORKERS)
+             if not part.empty]
+    return ingest.merge_frames(parts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('source', help='каталог или glob-шаблон CSV-файлов')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--chunk-rows', type=int, default=None)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    df = load_files(args.source, args.workers, args.chunk_rows)
+    print(f'{len(df)} rows in {time.perf_counter() - start:.2f} s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""Векторизованная предобработка датасета космических запусков."""
+import pandas as pd
+
+from launches import gazetteer, instrumentation, parsing, vehicles
+
+SOURCE_COLUMNS = ['Company Name', 'Location', 'Datum', 'Detail', 'Status Rocket', 'Rocket',
+                  'Status Mission']
+# поля разбора Location (launches/gazetteer.py) и колонки таблицы для них
+LOCATION_COLUMNS = {'pad': 'Pad', 'site': 'Site', 'region': 'Region', 'country': 'Country',
+                    'operator_country': 'Operator Country'}
+CATEGORICAL_COLUMNS = ['Company Name', 'Country', 'Status Mission', 'Status Rocket', 'Pad', 'Site',
+                       'Region', 'Operator Country']
+
+
+def read_launches(path):
+    df = pd.read_csv(path)
+    df.drop(['Unnamed: 0.1', 'Unnamed: 0'], axis=1, inplace=True)
+    return df
+
+
+def extract_location(location):
+    return gazetteer.locate(location).rename(columns=LOCATION_COLUMNS)
+
+
+def parse_columns(df):
+    df.rename(columns={" Rocket": "Rocket"}, inplace=True)
+    df.attrs['parse_report'] = parsing.parse_columns(df)
+
+
+def add_location(df):
+    for column, values in extract_location(df['Location']).items():
+        df[column] = values
+
+
+def add_dates(df):
+    df['Year'] = df['Datum'].dt.year
+    df['Month'] = df['Datum'].dt.month
+    df['Weekday'] = df['Datum'].dt.weekday
+
+
+def add_vehicle_family(df):
+    df['Vehicle Family'] = vehicles.classify(df['Detail'])
+
+
+def add_categoricals(df):
+    for column in CATEGORICAL_COLUMNS:
+        df[column] = df[column].astype('category')
+
+
+STEPS = {
+    'parse': parse_columns,
+    'location': add_location,
+    'dates': add_dates,
+    'vehicles': add_vehicle_family,
+    'categoricals': add_categoricals,
+}
+
+
+def preprocess(df):
+    for name, step in STEPS.items():
+        with instrumentation.timed(f'preprocess:{name}'):
+            step(df)
+    return df
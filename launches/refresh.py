@@ -0,0 +1,187 @@
+"""Фоновое обновление данных, не зависящее от отрисовки страницы.
+
+RefreshWorker в отдельном потоке раз в interval секунд проверяет основной CSV
+и необязательный каталог DROP_DIR (по умолчанию incoming) или glob-шаблон,
+куда складываются новые файлы с запусками (*.csv); пока файлов нет, следит
+только за CSV. Без основного CSV (path=None) данные целиком берутся из файлов. Если
+что-то изменилось, он перестраивает таблицу и куб и одной операцией
+присваивания публикует новый Snapshot. Страница всегда читает последний
+готовый снимок через current() и никогда не ждет пересборки.
+
+Основной CSV обновляется через LaunchHistory (дописанный хвост читается
+отдельно), каждый файл из DROP_DIR предобрабатывается один раз и
+перечитывается, только если он изменился; новые и измененные файлы
+предобрабатываются в пуле процессов (launches/parallel.py). Удаленные файлы
+выпадают из данных.
+
+Метрики (metrics()): длительность последней пересборки, возраст снимка и
+сколько секунд данные отстают от найденных, но еще не примененных изменений.
+"""
+import glob
+import logging
+import os
+import threading
+import time
+from typing import NamedTuple, Optional
+
+import pandas as pd
+
+from launches import cube, ingest, parallel, storage
+
+logger = logging.getLogger(__name__)
+
+DROP_DIR = os.environ.get('LAUNCHES_DROP_DIR', 'incoming')
+INTERVAL = float(os.environ.get('LAUNCHES_REFRESH_SECONDS', 30))
+
+
+class Snapshot(NamedTuple):
+    frame: pd.DataFrame
+    cube: pd.DataFrame
+    version: int
+    # хеш основного CSV, если других файлов нет (для собранных артефактов)
+    source_hash: Optional[str]
+    built_at: float
+
+
+class RefreshWorker:
+    def __init__(self, path, drop_dir=None, interval=None, workers=None):
+        self.path = path
+        self.drop_dir = drop_dir or DROP_DIR
+        self.interval = INTERVAL if interval is None else interval
+        self.workers = workers
+        self.refresh_seconds = None
+        self.last_checked = None
+        self.last_error = None
+        self._snapshot = None
+        self._signature = None
+        self._failed_signature = None
+        self._pending_since = None
+        self._history = None
+        self._drops = {}
+        self._stop = threading.Event()
+        self._thread = None
+
+    def current(self):
+        """Последний полностью собранный снимок."""
+        return self._snapshot
+
+    def start(self):
+        """Собрать первый снимок в текущем потоке и запустить фоновые проверки."""
+        if self._snapshot is None:
+            self.poll(raise_errors=True)
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='launches-refresh',
+                                             daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.poll()
+
+    def drop_files(self):
+        pattern = self.drop_dir
+        if os.path.isdir(pattern):
+            pattern = os.path.join(pattern, '*.csv')
+        return {path: tuple(storage.source_version(path)) for path in sorted(glob.glob(pattern))}
+
+    def signature(self):
+        version = tuple(storage.source_version(self.path)) if self.path is not None else None
+        return version, tuple(self.drop_files().items())
+
+    def poll(self, raise_errors=False):
+        """Одна проверка источников. Возвращает True, если опубликован новый снимок."""
+        self.last_checked = time.time()
+        signature = None
+        try:
+            signature = self.signature()
+            if signature == self._signature:
+                # источники вернулись к опубликованному снимку (например, убрали битый файл)
+                self._pending_since = None
+                self._failed_signature = None
+                self.last_error = None
+                return False
+            # неудачную сборку повторяем, только когда источники снова изменятся
+            if signature == self._failed_signature:
+                return False
+            if self._pending_since is None:
+                self._pending_since = self.last_checked
+            self._rebuild(signature)
+        except Exception as error:
+            if raise_errors:
+                raise
+            self._failed_signature = signature
+            self.last_error = repr(error)
+            logger.exception('launch data refresh failed')
+            return False
+        return True
+
+    def _rebuild(self, signature):
+        start = time.perf_counter()
+        if self.path is None:
+            history = None
+        elif self._history is None:
+            history = ingest.LaunchHistory.from_csv(self.path)
+        else:
+            history = self._history
+            history.refresh()
+
+        files = dict(signature[1])
+        changed = [path for path, version in files.items()
+                   if path not in self._drops or self._drops[path][0] != version]
+        normalized = dict(zip(changed, parallel.normalize_files(changed, self.workers)))
+        drops = {}
+        for path, version in files.items():
+            if path in normalized:
+                frame = normalized[path]
+                drops[path] = (version, frame, cube.build_cube(frame))
+            else:
+                drops[path] = self._drops[path]
+
+        parts = [(x[1], x[2]) for x in drops.values() if not x[1].empty]
+        base = history.snapshot() if history is not None else None
+        if base is not None:
+            parts.insert(0, (base.frame, base.cube))
+        if not parts:
+            raise FileNotFoundError(f'no launch files match {self.drop_dir!r}')
+        frames, cubes = zip(*parts)
+        previous = self._snapshot
+        snapshot = Snapshot(
+            frame=ingest.merge_frames(list(frames)) if len(frames) > 1 else frames[0],
+            cube=ingest.merge_cubes(list(cubes)) if len(cubes) > 1 else cubes[0],
+            version=previous.version + 1 if previous else 1,
+            source_hash=base.source_hash if base is not None and not drops else None,
+            built_at=time.time(),
+        )
+
+        self._history, self._drops, self._signature = history, drops, signature
+        self._snapshot = snapshot
+        self._pending_since = None
+        self.last_error = None
+        self.refresh_seconds = time.perf_counter() - start
+        logger.info('launch data v%d: %d rows from %d files in %.3f s', snapshot.version,
+                    len(snapshot.frame), self._file_count(), self.refresh_seconds)
+
+    def _file_count(self):
+        return (self.path is not None) + len(self._drops)
+
+    def metrics(self):
+        snapshot = self._snapshot
+        now = time.time()
+        pending = self._pending_since
+        return {
+            'version': snapshot.version if snapshot else None,
+            'rows': len(snapshot.frame) if snapshot else 0,
+            'files': self._file_count(),
+            'refresh_seconds': self.refresh_seconds,
+            'age_seconds': now - snapshot.built_at if snapshot else None,
+            'stale_seconds': now - pending if pending is not None else 0.0,
+            'last_checked': self.last_checked,
+            'last_error': self.last_error,
+        }
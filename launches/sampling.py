@@ -0,0 +1,35 @@
+"""Ограничение объема данных, которые уходят в браузер.
+
+Таблица отдается постранично, а точечные графики при большом числе точек
+заменяются агрегированными бинами: одна точка на группу с числом запусков
+и средним значением.
+"""
+import math
+import os
+
+MAX_POINTS = int(os.environ.get('LAUNCHES_MAX_POINTS', 5000))
+PAGE_SIZE = 100
+
+
+def page_count(n_rows, page_size=PAGE_SIZE):
+    return max(1, math.ceil(n_rows / page_size))
+
+
+def page(df, number, page_size=PAGE_SIZE):
+    """Строки страницы number (с единицы)."""
+    start = (number - 1) * page_size
+    return df.iloc[start:start + page_size]
+
+
+def bin_points(df, by, value):
+    """Одна точка на группу by: среднее value и число строк в колонке 'Launches'."""
+    binned = df.groupby(by, observed=True)[value].agg(['mean', 'size'])
+    return binned.rename(columns={'mean': value, 'size': 'Launches'}).reset_index()
+
+
+def limit_points(df, by, value, max_points=None):
+    """Исходные точки, если их не больше max_points, иначе бины bin_points."""
+    max_points = MAX_POINTS if max_points is None else max_points
+    if len(df) <= max_points:
+        return df.assign(Launches=1)
+    return bin_points(df, by, value)
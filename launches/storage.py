@@ -0,0 +1,139 @@
+"""Колоночный кеш предобработанного датасета в формате Feather (Arrow IPC).
+
+Файл пишется без сжатия, чтобы его можно было отобразить в память. В метаданных
+хранится версия исходного CSV (mtime и размер) и хеш кода пакета launches
+вместе со справочниками launches/data: если изменился CSV, предобработка или
+справочник мест, кеш считается устаревшим и пересобирается.
+
+Кеш собирается на этапе сборки приложения (bin/post_compile); актуальный кеш
+не пересобирается:
+
+    python -m launches.storage Space_Corrected.csv
+"""
+import functools
+import glob
+import hashlib
+import json
+import os
+import sys
+
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from launches import instrumentation, preprocessing
+
+CACHE_DIR = os.environ.get('LAUNCHES_CACHE_DIR', '.cache')
+_VERSION_KEY = b'launches.source_version'
+_CODE_KEY = b'launches.code_hash'
+_ATTRS_KEY = b'launches.attrs'
+_HASH_BLOCK = 1 << 20
+
+
+def source_version(path):
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def prefix_hash(path, size):
+    """Хеш первых size байтов файла; объект можно продлить следующими байтами."""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as file:
+        while size > 0:
+            block = file.read(min(size, _HASH_BLOCK))
+            if not block:
+                break
+            digest.update(block)
+            size -= len(block)
+    return digest
+
+
+def content_hash(path):
+    return prefix_hash(path, os.path.getsize(path)).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def code_hash():
+    """Хеш всех модулей пакета launches и файлов launches/data."""
+    package = os.path.dirname(__file__)
+    paths = glob.glob(os.path.join(package, '*.py')) + glob.glob(os.path.join(package, 'data', '*'))
+    digest = hashlib.sha1()
+    for path in sorted(paths):
+        digest.update(os.path.relpath(path, package).encode())
+        with open(path, 'rb') as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+
+def cache_path(csv_path, cache_dir=None):
+    name = os.path.splitext(os.path.basename(csv_path))[0] + '.feather'
+    return os.path.join(cache_dir or CACHE_DIR, name)
+
+
+def _cache_metadata(path):
+    try:
+        with pa.memory_map(path) as source:
+            return pa.ipc.open_file(source).schema.metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return {}
+
+
+def cached_version(path):
+    version = _cache_metadata(path).get(_VERSION_KEY)
+    return json.loads(version) if version else None
+
+
+def is_stale(csv_path, path=None):
+    metadata = _cache_metadata(path or cache_path(csv_path))
+    version = metadata.get(_VERSION_KEY)
+    return (version is None or json.loads(version) != source_version(csv_path)
+            or metadata.get(_CODE_KEY) != code_hash().encode())
+
+
+def write_cache(df, path, version):
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[_VERSION_KEY] = json.dumps(version).encode()
+    metadata[_CODE_KEY] = code_hash().encode()
+    metadata[_ATTRS_KEY] = json.dumps(df.attrs).encode()
+    table = table.replace_schema_metadata(metadata)
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    feather.write_feather(table, tmp_path, compression='uncompressed')
+    os.replace(tmp_path, path)
+
+
+def build_cache(csv_path, path=None):
+    path = path or cache_path(csv_path)
+    version = source_version(csv_path)
+    df = preprocessing.preprocess(preprocessing.read_launches(csv_path))
+    write_cache(df, path, version)
+    return df
+
+
+def read_cache(path):
+    table = feather.read_table(path, memory_map=True)
+    df = table.to_pandas()
+    attrs = (table.schema.metadata or {}).get(_ATTRS_KEY)
+    if attrs:
+        df.attrs.update(json.loads(attrs))
+    return df
+
+
+def load_launches(csv_path, path=None):
+    """Предобработанный датасет: из кеша, если он актуален, иначе из CSV с пересборкой кеша."""
+    path = path or cache_path(csv_path)
+    if is_stale(csv_path, path):
+        with instrumentation.timed('load:build_cache'):
+            return build_cache(csv_path, path)
+    with instrumentation.timed('load:read_cache'):
+        return read_cache(path)
+
+
+if __name__ == '__main__':
+    for csv_path in sys.argv[1:] or ['Space_Corrected.csv']:
+        if is_stale(csv_path):
+            build_cache(csv_path)
+            print(f'{csv_path} -> {cache_path(csv_path)}')
+        else:
+            print(f'{cache_path(csv_path)} is up to date')
@@ -0,0 +1,109 @@
+"""Потоковый режим: куб запусков без загрузки всей таблицы в память.
+
+CSV читается порциями по CHUNK_ROWS строк. Каждая порция предобрабатывается,
+сворачивается в маленький куб (launches/cube.py) и сразу вливается в общий,
+после чего строки порции отбрасываются. Память ограничена числом групп куба,
+а не числом строк. Все графики по кубу (figures.CUBE_FIGURES) строятся из
+него без изменений.
+
+Проверить, что потоковые агрегаты совпадают с расчетом по полной таблице:
+
+    python -m launches.streaming Space_Corrected.csv --check
+"""
+import argparse
+import sys
+import time
+
+import pandas as pd
+
+from launches import aggregations, cube, ingest, parallel, parsing
+
+PERIODS = ['Year', 'Month', 'Weekday']
+
+
+def stream_cube(source, chunk_rows=None):
+    """Куб по всем файлам source (путь, каталог или glob), собранный порциями."""
+    launches = None
+    reports = []
+    rows = 0
+    for chunk in parallel.read_chunks(parallel.launch_files(source), chunk_rows):
+        part = ingest.normalize(chunk)
+        rows += len(part)
+        reports.append(part.attrs['parse_report'])
+        delta = cube.build_cube(part)
+        launches = delta if launches is None else ingest.merge_cubes([launches, delta])
+    launches.attrs['rows'] = rows
+    launches.attrs['parse_report'] = parsing.merge_reports(reports)
+    return launches
+
+
+def aggregates(data, weight=None):
+    """Агрегаты отчета по строкам запусков или, если задан weight, по кубу.
+
+    Статусы для waffle, число запусков каждого статуса по странам и компаниям,
+    доля провалов по годам, месяцам и дням недели и средняя стоимость по годам.
+    """
+    def count(frame, by):
+        if weight is None:
+            return frame.groupby(by, observed=True).size()
+        return frame.groupby(by, observed=True)[weight].sum()
+
+    result = {
+        'status': count(data, 'Status Mission'),
+        'country_status': aggregations.status_counts(data, 'Country', weight),
+        'company_status': aggregations.status_counts(data, 'Company Name', weight),
+    }
+    failed = data[data['Status Mission'] == 'Failure']
+    for period in PERIODS:
+        totals = count(data, period)
+        result[f'failure_rate:{period}'] = (
+            count(failed, period).reindex(totals.index, fill_value=0) / totals * 100.0)
+    if weight is None:
+        costed = data[data['Rocket'] > 0]
+        result['mean_cost'] = (costed['Rocket'].astype('float64').groupby(costed['Year']).sum()
+                               / costed.groupby('Year').size())
+    else:
+        result['mean_cost'] = cube.mean_cost(data, 'Year')
+    return result
+
+
+def mismatches(expected, actual):
+    """Имена агрегатов, значения которых различаются."""
+    different = []
+    for name, value in expected.items():
+        try:
+            if isinstance(value, pd.Series):
+                pd.testing.assert_series_equal(
+                    value.astype('float64'), actual[name].astype('float64'),
+                    check_exact=True, check_names=False, check_index_type=False)
+            else:
+                pd.testing.assert_frame_equal(
+                    value.astype('float64'), actual[name].astype('float64'),
+                    check_exact=True, check_names=False, check_index_type=False,
+                    check_column_type=False, check_categorical=False)
+        except AssertionError:
+            different.append(name)
+    return different
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('source', nargs='?', default='Space_Corrected.csv')
+    parser.add_argument('--chunk-rows', type=int, default=None)
+    parser.add_argument('--check', action='store_true',
+                        help='сравнить с агрегатами по полной таблице в памяти')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    launches = stream_cube(args.source, args.chunk_rows)
+    print(f"{launches.attrs['rows']} rows -> {len(launches)} groups "
+          f'in {time.perf_counter() - start:.2f} s')
+    if args.check:
+        df = parallel.load_files(args.source, workers=1)
+        different = mismatches(aggregates(df), aggregates(launches, weight='Launches'))
+        print('mismatched: ' + ', '.join(different) if different else 'all aggregates match')
+        sys.exit(1 if different else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""Классификация ракет-носителей по семействам.
+
+Список семейств - это данные: порядок задает приоритет, если в названии
+упоминается несколько семейств (например, 'Thor DM-19 Delta' - это Delta).
+Все названия собираются в одно скомпилированное регулярное выражение в виде
+префиксного дерева внутри опережающей проверки: findall за один проход на C
+находит все вхождения, в том числе перекрывающиеся ('Soyuz' и 'Soyuz-U'), и
+время почти не зависит от длины списка семейств.
+"""
+import functools
+import re
+
+import numpy as np
+import pandas as pd
+
+VEHICLE_FAMILIES = ('Atlas', 'Ariane', 'Cosmos', 'Delta', 'Falcon', 'GSLV', 'Long March',
+                    'Molniya', 'PSLV', 'Soyuz', 'Thor', 'Titan', 'Tsyklon', 'Vostok', 'Zenit')
+OTHER = 'Other'
+
+
+def _trie_regex(trie):
+    if '' in trie and len(trie) == 1:
+        return ''
+    branches = [re.escape(char) + _trie_regex(child)
+                for char, child in sorted(trie.items()) if char]
+    optional = '' in trie
+    if len(branches) == 1 and not optional:
+        return branches[0]
+    return '(?:' + '|'.join(branches) + ')' + ('?' if optional else '')
+
+
+@functools.lru_cache(maxsize=8)
+def compile_families(families):
+    """Регулярное выражение-дерево внутри опережающей проверки и лучшие семейства для совпадений.
+
+    На каждой позиции дерево жадно находит самое длинное название; все остальные
+    семейства, начинающиеся там же, - его префиксы. Поэтому для каждого названия
+    заранее считается (номер, семейство) самого приоритетного из его префиксов.
+    """
+    trie = {}
+    ranks = {}
+    for rank, family in enumerate(families):
+        node = trie
+        for char in family:
+            node = node.setdefault(char, {})
+        node[''] = {}
+        ranks.setdefault(family, rank)
+    first = ''.join(sorted({re.escape(family[0]) for family in ranks}))
+    best = {name: min((rank, family) for family, rank in ranks.items() if name.startswith(family))
+            for name in ranks}
+    return re.compile(f'(?=[{first}])(?=({_trie_regex(trie)}))'), best
+
+
+def vehicle_name(detail):
+    return detail.split('|')[0].strip()
+
+
+def classify_one(name, families=VEHICLE_FAMILIES):
+    """Семейство с наименьшим номером в списке среди всех вхождений, в том числе перекрывающихся."""
+    pattern, best = compile_families(families)
+    found = pattern.findall(name)
+    return min(map(best.__getitem__, found))[1] if found else OTHER
+
+
+def classify(detail, families=VEHICLE_FAMILIES):
+    """Семейство ракеты-носителя для каждой строки Detail в виде категориальной колонки.
+
+    Каждая уникальная строка разбирается один раз.
+    """
+    families = tuple(families)
+    codes, uniques = pd.factorize(detail)
+    categories = list(families) + [OTHER]
+    lookup = {family: code for code, family in enumerate(categories)}
+    unique_codes = [lookup[classify_one(vehicle_name(x), families)] for x in uniques]
+    # код -1 (пропуск в Detail) указывает на добавленный в конец -1
+    values = np.array(unique_codes + [-1], dtype=np.int16)[codes]
+    return pd.Series(pd.Categorical.from_codes(values, categories=categories),
+                     index=detail.index, name='Vehicle Family')
@@ -0,0 +1,76 @@
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+from launches import artifacts, gazetteer, storage
+
+SOURCE = os.path.join(os.path.dirname(__file__), os.pardir, 'Space_Corrected.csv')
+
+
+@pytest.fixture
+def launches_csv(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, 'CACHE_DIR', str(tmp_path / 'cache'))
+    path = tmp_path / 'launches.csv'
+    pd.read_csv(SOURCE, nrows=200).to_csv(path, index=False)
+    return str(path)
+
+
+def test_build_is_keyed_by_content_not_mtime(launches_csv, tmp_path):
+    out = str(tmp_path / 'build')
+    artifacts.build(launches_csv, out)
+
+    # свежий checkout: те же байты, другое время изменения
+    copy = str(tmp_path / 'checkout.csv')
+    shutil.copy(launches_csv, copy)
+    os.utime(copy, ns=(0, 0))
+    source_hash = storage.content_hash(copy)
+    assert artifacts.load_figure('treemap', source_hash, out) is not None
+    assert artifacts.load_waffle(source_hash, out)
+
+    with open(copy, 'a') as file:
+        file.write(open(launches_csv).read().splitlines()[1] + '\n')
+    assert artifacts.load_figure('treemap', storage.content_hash(copy), out) is None
+
+
+def test_build_is_invalidated_by_figure_code(launches_csv, tmp_path, monkeypatch):
+    out = str(tmp_path / 'build')
+    artifacts.build(launches_csv, out)
+    monkeypatch.setattr(storage, 'code_hash', lambda: '0' * 40)
+    assert artifacts.load_figure('treemap', storage.content_hash(launches_csv), out) is None
+
+
+@pytest.fixture
+def edited_sites():
+    with open(gazetteer.SITES_PATH, 'rb') as file:
+        original = file.read()
+    storage.code_hash.cache_clear()
+    try:
+        yield gazetteer.SITES_PATH
+    finally:
+        with open(gazetteer.SITES_PATH, 'wb') as file:
+            file.write(original)
+        storage.code_hash.cache_clear()
+
+
+def test_build_is_invalidated_by_sites_reference(launches_csv, tmp_path, edited_sites):
+    out = str(tmp_path / 'build')
+    artifacts.build(launches_csv, out)
+    source_hash = storage.content_hash(launches_csv)
+    assert artifacts.load_figure('treemap', source_hash, out) is not None
+
+    with open(edited_sites, 'a', encoding='utf-8') as file:
+        file.write('Kourou,site,French Guiana,France\n')
+    storage.code_hash.cache_clear()
+    assert artifacts.load_figure('treemap', source_hash, out) is None
+    assert storage.is_stale(launches_csv)
+
+
+def test_build_writes_aggregate_tables(launches_csv, tmp_path):
+    out = str(tmp_path / 'build')
+    artifacts.build(launches_csv, out)
+    source_hash = storage.content_hash(launches_csv)
+    for name in ['company_status_shares', 'country_status_shares', 'cumulative_launches',
+                 'mean_cost']:
+        assert not artifacts.load_table(name, source_hash, out).empty
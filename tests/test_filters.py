@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from launches import filters
+
+
+def mask_positions(df, chosen):
+    mask = pd.Series(True, index=df.index)
+    for column, value in chosen.items():
+        if not value:
+            continue
+        if column == filters.YEAR:
+            mask &= df[column].between(*value)
+        else:
+            mask &= df[column].isin(value)
+    return np.flatnonzero(mask.to_numpy())
+
+
+@pytest.fixture
+def frame():
+    # 13 строк - не кратно 8; пропуски в категориях (код -1) и в годах
+    return pd.DataFrame({
+        'Country': pd.Categorical(['USA', 'China', None, 'USA', 'France', 'China', 'USA',
+                                   None, 'France', 'USA', 'China', 'USA', 'France']),
+        'Company Name': ['NASA', 'CASC', 'CASC', 'SpaceX', 'Arianespace', None, 'NASA',
+                         'SpaceX', 'Arianespace', 'NASA', 'CASC', 'SpaceX', None],
+        'Vehicle Family': pd.Categorical(['Atlas', 'Long March', 'Long March', 'Falcon',
+                                          'Ariane', 'Long March', 'Delta', 'Falcon', 'Ariane',
+                                          'Atlas', 'Long March', 'Falcon', 'Ariane'],
+                                         categories=['Atlas', 'Ariane', 'Delta', 'Falcon',
+                                                     'Long March', 'Other']),
+        'Year': [1957, 1970, 1970, 2010, 1980, np.nan, 1965, 2020, 1999, 1962, 2015, 2019, 1980],
+    })
+
+
+@pytest.fixture
+def index(frame):
+    return filters.FilterIndex(frame)
+
+
+@pytest.mark.parametrize('chosen', [
+    {'Country': ['USA']},
+    {'Country': ['USA', 'France'], 'Year': (1960, 2000)},
+    {'Company Name': ['CASC'], 'Vehicle Family': ['Long March']},
+    {'Vehicle Family': ['Other']},
+    {'Year': (1970, 1970)},
+    {'Year': (1900, 2100)},
+    {'Year': (1958, 1964)},
+    {'Country': [], 'Year': (1980, 2020)},
+])
+def test_positions_match_masks(frame, index, chosen):
+    assert np.array_equal(index.positions(chosen), mask_positions(frame, chosen))
+
+
+def test_no_filters(frame, index):
+    assert index.positions({}) is None
+    assert index.positions({'Country': [], 'Company Name': None}) is None
+    assert index.select(frame, {}) is frame
+
+
+@pytest.mark.parametrize('years', [(2000, 1990), (1971, 1979), (2021, 2030), (1900, 1956)])
+def test_empty_year_ranges(frame, index, years):
+    assert index.positions({'Year': years}).size == 0
+    assert mask_positions(frame, {'Year': years}).size == 0
+
+
+def test_unknown_labels(frame, index):
+    assert index.positions({'Country': ['Atlantis']}).size == 0
+    chosen = {'Country': ['Atlantis', 'France']}
+    assert np.array_equal(index.positions(chosen), mask_positions(frame, chosen))
+
+
+def test_missing_values_are_never_selected(frame, index):
+    everything = {'Country': index.options('Country'), 'Company Name': index.options('Company Name'),
+                  'Year': index.year_bounds()}
+    positions = index.positions(everything)
+    assert np.array_equal(positions, mask_positions(frame, everything))
+    assert not set(positions) & {2, 5, 7, 12}
+
+
+def test_random_filters_match_masks(frame, index):
+    rng = np.random.default_rng(0)
+    low, high = index.year_bounds()
+    for _ in range(200):
+        chosen = {}
+        for column in filters.COLUMNS:
+            options = index.options(column) + ['Unknown']
+            chosen[column] = list(rng.choice(options, size=rng.integers(0, 3), replace=False))
+        chosen['Year'] = tuple(int(x) for x in rng.integers(low - 5, high + 5, size=2))
+        assert np.array_equal(index.positions(chosen), mask_positions(frame, chosen))
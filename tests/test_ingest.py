@@ -0,0 +1,64 @@
+import os
+
+import pandas as pd
+import pytest
+
+from launches import ingest, storage
+
+SOURCE = os.path.join(os.path.dirname(__file__), os.pardir, 'Space_Corrected.csv')
+
+
+@pytest.fixture
+def launches_csv(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, 'CACHE_DIR', str(tmp_path / 'cache'))
+    path = tmp_path / 'launches.csv'
+    pd.read_csv(SOURCE, nrows=50).to_csv(path, index=False)
+    return path
+
+
+def append_rows(path, rows):
+    with open(path, 'a') as file:
+        file.write(rows.to_csv(index=False, header=False))
+
+
+def touch(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def fresh(path):
+    return ingest.normalize(str(path))
+
+
+def test_refresh_reads_appended_tail(launches_csv):
+    history = ingest.LaunchHistory.from_csv(str(launches_csv))
+    append_rows(launches_csv, pd.read_csv(SOURCE, skiprows=range(1, 51), nrows=5))
+    touch(launches_csv)
+
+    assert history.refresh()
+    assert len(history._frames) == 2
+    pd.testing.assert_series_equal(history.frame['Status Mission'].astype(str),
+                                   fresh(launches_csv)['Status Mission'].astype(str))
+
+
+def test_refresh_reloads_when_read_part_was_edited(launches_csv):
+    history = ingest.LaunchHistory.from_csv(str(launches_csv))
+    rows = pd.read_csv(launches_csv)
+    assert rows.loc[0, 'Status Mission'] == 'Success'
+    rows.loc[0, 'Status Mission'] = 'Failure'
+    rows.to_csv(launches_csv, index=False)
+    append_rows(launches_csv, pd.read_csv(SOURCE, skiprows=range(1, 51), nrows=1))
+    touch(launches_csv)
+
+    assert history.refresh()
+    snapshot = history.snapshot()
+    assert snapshot.frame.loc[0, 'Status Mission'] == 'Failure'
+    assert len(snapshot.frame) == 51
+    assert snapshot.source_hash == storage.content_hash(str(launches_csv))
+
+
+def test_refresh_without_source_file_is_a_no_op(launches_csv):
+    history = ingest.LaunchHistory.from_files(str(launches_csv.parent / '*.csv'), workers=1)
+    assert not history.refresh()
+    assert history.snapshot().source_hash is None
+    assert len(history.frame) == 50
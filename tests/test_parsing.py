@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+
+from launches import parsing
+
+
+def test_parse_datum_fixed_width():
+    datum = pd.Series(['Fri Aug 07, 2020 05:12 UTC', 'Fri Oct 04, 1957 19:28 UTC'])
+    assert parsing.parse_datum(datum).tolist() == [pd.Timestamp('2020-08-07 05:12'),
+                                                   pd.Timestamp('1957-10-04 19:28')]
+
+
+def test_parse_datum_fallback_formats():
+    datum = pd.Series(['Thu Aug 29, 2019', 'Fri Aug 7, 2020 05:12 UTC', 'Sat Mar 1, 1958',
+                       'Fri Aug 07, 2020 05:12 UTC'])
+    assert parsing.parse_datum(datum).tolist() == [
+        pd.Timestamp('2019-08-29'), pd.Timestamp('2020-08-07 05:12'),
+        pd.Timestamp('1958-03-01'), pd.Timestamp('2020-08-07 05:12')]
+
+
+def test_parse_datum_malformed():
+    # 26 символов с ' UTC' в конце, но с неизвестным месяцем: быстрый путь не подходит
+    datum = pd.Series(['Fri Xyz 07, 2020 05:12 UTC', 'yesterday', None, ''])
+    parsed = parsing.parse_datum(datum)
+    assert parsed.isna().all()
+    assert parsing.count_malformed(datum, parsed) == 2
+
+
+def test_parse_cost():
+    cost = pd.Series(['50.0 ', '5,000.0 ', '', '  ', None, 'n/a', ' 29.75'])
+    parsed = parsing.parse_cost(cost)
+    assert parsed.dtype == np.float32
+    assert parsed.tolist()[:2] == [50.0, 5000.0]
+    assert parsed[[2, 3, 4, 5]].isna().all()
+    assert parsed[6] == np.float32(29.75)
+    # пустые строки и пропуски - не ошибки, некорректна только 'n/a'
+    assert parsing.count_malformed(cost, parsed) == 1
+
+
+def test_parse_cost_numeric():
+    parsed = parsing.parse_cost(pd.Series([1.5, np.nan]))
+    assert parsed.dtype == np.float32
+    assert parsing.count_malformed(pd.Series([1.5, np.nan]), parsed) == 0
+
+
+def test_parse_columns_report():
+    df = pd.DataFrame({'Datum': ['Fri Aug 07, 2020 05:12 UTC', 'never'],
+                       'Rocket': ['1,200.0 ', 'free']})
+    report = parsing.parse_columns(df)
+    assert {column: stats['malformed'] for column, stats in report.items()} == {
+        'Datum': 1, 'Rocket': 1}
+    assert report['Datum']['rows'] == 2
+    assert df['Rocket'][0] == 1200.0
@@ -0,0 +1,22 @@
+import pandas as pd
+
+from launches import preprocessing
+
+
+def test_location_fields_are_categorical_columns():
+    df = preprocessing.preprocess(pd.DataFrame({
+        'Company Name': ['RVSN USSR', 'Sea Launch'],
+        'Location': ['Site 1/5, Baikonur Cosmodrome, Kazakhstan',
+                     'Ocean Odyssey, Pacific Missile Range Facility'],
+        'Datum': ['Fri Oct 04, 1957 19:28 UTC', 'Thu Aug 29, 2019'],
+        'Detail': ['Sputnik 8K71PS | Sputnik-1', 'Zenit-3SL | Intelsat'],
+        'Status Rocket': ['StatusRetired', 'StatusRetired'],
+        ' Rocket': [None, None],
+        'Status Mission': ['Success', 'Success'],
+    }))
+    for column in preprocessing.LOCATION_COLUMNS.values():
+        assert isinstance(df[column].dtype, pd.CategoricalDtype)
+    assert df['Site'].tolist() == ['Baikonur Cosmodrome', 'Ocean Odyssey']
+    assert df['Country'].tolist() == ['Kazakhstan', 'USA']
+    assert df['Operator Country'].tolist() == ['Russian Federation', 'USA']
+    assert df['Region'].isna().tolist() == [True, False]
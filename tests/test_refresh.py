@@ -0,0 +1,69 @@
+import os
+
+import pandas as pd
+import pytest
+
+from launches import refresh, storage
+
+SOURCE = os.path.join(os.path.dirname(__file__), os.pardir, 'Space_Corrected.csv')
+
+
+@pytest.fixture
+def worker(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, 'CACHE_DIR', str(tmp_path / 'cache'))
+    path = tmp_path / 'launches.csv'
+    pd.read_csv(SOURCE, nrows=50).to_csv(path, index=False)
+    drop = tmp_path / 'drop'
+    drop.mkdir()
+    # без фонового потока: проверки вызываются явно через poll()
+    worker = refresh.RefreshWorker(str(path), str(drop))
+    worker.poll(raise_errors=True)
+    return worker
+
+
+def test_drop_file_is_added_and_removed(worker):
+    extra = os.path.join(worker.drop_dir, 'extra.csv')
+    pd.read_csv(SOURCE, skiprows=range(1, 51), nrows=10).to_csv(extra, index=False)
+    assert worker.poll()
+    assert len(worker.current().frame) == 60
+    assert worker.current().source_hash is None
+
+    os.remove(extra)
+    assert worker.poll()
+    assert len(worker.current().frame) == 50
+    assert worker.current().source_hash == storage.content_hash(worker.path)
+
+
+def test_metrics_recover_when_bad_file_is_removed(worker):
+    bad = os.path.join(worker.drop_dir, 'bad.csv')
+    with open(bad, 'w') as file:
+        file.write('garbage\n1\n')
+    assert not worker.poll()
+    assert worker.metrics()['last_error']
+    assert worker.metrics()['stale_seconds'] >= 0
+    assert worker.current().version == 1
+
+    os.remove(bad)
+    assert not worker.poll()
+    metrics = worker.metrics()
+    assert metrics['last_error'] is None
+    assert metrics['stale_seconds'] == 0.0
+    assert worker.current().version == 1
+
+
+def test_worker_reads_source_files_without_main_csv(tmp_path):
+    source = tmp_path / 'source'
+    source.mkdir()
+    full = pd.read_csv(SOURCE, nrows=90)
+    for number, start in enumerate(range(0, 90, 30)):
+        full.iloc[start:start + 30].to_csv(source / f'part{number}.csv', index=False)
+    worker = refresh.RefreshWorker(None, str(source / 'part*.csv'), workers=2)
+    worker.poll(raise_errors=True)
+    snapshot = worker.current()
+    assert len(snapshot.frame) == 90
+    assert snapshot.source_hash is None
+    assert worker.metrics()['files'] == 3
+
+    os.remove(source / 'part2.csv')
+    assert worker.poll()
+    assert len(worker.current().frame) == 60
@@ -0,0 +1,36 @@
+import os
+
+import pandas as pd
+import pytest
+
+from launches import storage
+
+SOURCE = os.path.join(os.path.dirname(__file__), os.pardir, 'Space_Corrected.csv')
+
+
+@pytest.fixture
+def launches_csv(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, 'CACHE_DIR', str(tmp_path / 'cache'))
+    path = tmp_path / 'launches.csv'
+    pd.read_csv(SOURCE, nrows=50).to_csv(path, index=False)
+    return str(path)
+
+
+def test_cache_is_fresh_after_build(launches_csv):
+    assert storage.is_stale(launches_csv)
+    storage.build_cache(launches_csv)
+    assert not storage.is_stale(launches_csv)
+    assert len(storage.load_launches(launches_csv)) == 50
+
+
+def test_cache_is_stale_when_code_changes(launches_csv, monkeypatch):
+    storage.build_cache(launches_csv)
+    monkeypatch.setattr(storage, 'code_hash', lambda: '0' * 40)
+    assert storage.is_stale(launches_csv)
+
+
+def test_cache_is_stale_when_csv_changes(launches_csv):
+    storage.build_cache(launches_csv)
+    with open(launches_csv, 'a') as file:
+        file.write(open(launches_csv).read().splitlines()[1] + '\n')
+    assert storage.is_stale(launches_csv)
@@ -0,0 +1,33 @@
+import pandas as pd
+
+from launches import vehicles
+
+
+def legacy_family(name, families):
+    for family in families:
+        if family in name:
+            return family
+    return vehicles.OTHER
+
+
+def test_list_order_sets_priority_for_prefix_names():
+    assert vehicles.classify_one('Soyuz-U', ('Soyuz', 'Soyuz-U')) == 'Soyuz'
+    assert vehicles.classify_one('Soyuz-U', ('Soyuz-U', 'Soyuz')) == 'Soyuz-U'
+
+
+def test_list_order_sets_priority_for_overlapping_names():
+    assert vehicles.classify_one('XYZ', ('YZ', 'XY')) == 'YZ'
+    assert vehicles.classify_one('XYZ', ('XY', 'YZ')) == 'XY'
+
+
+def test_matches_first_family_in_list():
+    families = ('Delta', 'Thor', 'Long March', 'Long', 'March 3', 'ch 3B')
+    for name in ['Thor DM-19 Delta', 'Long March 3B', 'March 3', 'Titan', 'ch 3B Long']:
+        assert vehicles.classify_one(name, families) == legacy_family(name, families)
+
+
+def test_classify_uses_rocket_name_before_pipe():
+    detail = pd.Series(['Falcon 9 Block 5 | Starlink', 'Soyuz 2.1a | Progress MS-15', None])
+    result = vehicles.classify(detail)
+    assert list(result[:2]) == ['Falcon', 'Soyuz']
+    assert pd.isna(result[2])